@@ -124,7 +124,7 @@ class BaseActor:
         if domain:  # StakeHolder config inherits from character config, which has 'domains' - See #1580
             self.network = domain
 
-        self._saved_receipts = list()  # track receipts of transmitted transactions
+        self._saved_receipts = list()  # track (time.time(), receipt) of transmitted transactions
 
     def __repr__(self):
         class_name = self.__class__.__name__
@@ -18,6 +18,7 @@
 import eth_utils
 import functools
 import inspect
+import time
 from constant_sorrow.constants import (
     CONTRACT_ATTRIBUTE,
     CONTRACT_CALL,
@@ -28,6 +29,7 @@ from constant_sorrow.constants import (
 from datetime import datetime
 from typing import Callable, Optional, Union
 
+from nucypher.blockchain.eth.fast_checksum import cached_is_checksum_address
 from nucypher.types import ContractReturnValue
 from nucypher.utilities.logging import Logger
 
@@ -39,9 +41,6 @@ ContractInterfaces = Union[
 ]
 
 
-__VERIFIED_ADDRESSES = set()
-
-
 class InvalidChecksumAddress(eth_utils.exceptions.ValidationError):
     pass
 
@@ -63,45 +62,75 @@ def validate_checksum_address(func: Callable) -> Callable:
     parameter_name_suffix = '_address'
     aliases = ('account', 'address')
     log = Logger('EIP-55-validator')
-
-    @functools.wraps(func)
-    def wrapped(*args, **kwargs):
-
-        # Check for the presence of checksum addresses in this call
-        params = inspect.getcallargs(func, *args, **kwargs)
-        addresses_as_parameters = (parameter_name for parameter_name in params
-                                   if parameter_name.endswith(parameter_name_suffix)
-                                   or parameter_name in aliases)
-
-        for parameter_name in addresses_as_parameters:
-            checksum_address = params[parameter_name]
-
-            if checksum_address in __VERIFIED_ADDRESSES:
-                continue
-
-            signature = inspect.signature(func)
-            parameter_is_optional = signature.parameters[parameter_name].default is None
-            if parameter_is_optional and checksum_address is None or checksum_address is NO_BLOCKCHAIN_CONNECTION:
-                continue
-
-            address_is_valid = eth_utils.is_checksum_address(checksum_address)
-            # OK!
-            if address_is_valid:
-                __VERIFIED_ADDRESSES.add(checksum_address)
-                continue
-
-            # Invalid Type
-            if not isinstance(checksum_address, str):
-                actual_type_name = checksum_address.__class__.__name__
-                message = '{} is an invalid type for parameter "{}".'.format(actual_type_name, parameter_name)
-                log.debug(message)
-                raise TypeError(message)
-
-            # Invalid Value
-            message = '"{}" is not a valid EIP-55 checksum address.'.format(checksum_address)
+    empty = object()  # sentinel for parameters without a default value
+
+    # Resolve the address parameters once, at decoration time, directly from the code object.
+    code = func.__code__
+    positional_names = code.co_varnames[:code.co_argcount]
+    keyword_only_names = code.co_varnames[code.co_argcount:code.co_argcount + code.co_kwonlyargcount]
+    defaults = func.__defaults__ or ()
+    default_values = dict(zip(positional_names[len(positional_names) - len(defaults):], defaults))
+    default_values.update(func.__kwdefaults__ or {})
+
+    addresses_as_parameters = list()
+    for index, parameter_name in enumerate(positional_names + keyword_only_names):
+        if parameter_name.endswith(parameter_name_suffix) or parameter_name in aliases:
+            addresses_as_parameters.append((parameter_name,
+                                            index if index < code.co_argcount else None,
+                                            default_values.get(parameter_name, empty)))
+    addresses_as_parameters = tuple(addresses_as_parameters)
+
+    # Nothing to validate; leave the function undecorated.
+    if not addresses_as_parameters:
+        return func
+
+    def validate(parameter_name: str, default, checksum_address) -> None:
+        parameter_is_optional = default is None
+        if parameter_is_optional and checksum_address is None or checksum_address is NO_BLOCKCHAIN_CONNECTION:
+            return
+
+        # OK!
+        if isinstance(checksum_address, str) and cached_is_checksum_address(checksum_address):
+            return
+
+        # Invalid Type
+        if not isinstance(checksum_address, str):
+            actual_type_name = checksum_address.__class__.__name__
+            message = '{} is an invalid type for parameter "{}".'.format(actual_type_name, parameter_name)
             log.debug(message)
-            raise InvalidChecksumAddress(message)
-        else:
+            raise TypeError(message)
+
+        # Invalid Value
+        message = '"{}" is not a valid EIP-55 checksum address.'.format(checksum_address)
+        log.debug(message)
+        raise InvalidChecksumAddress(message)
+
+    if len(addresses_as_parameters) == 1:
+        # The common case: a single address parameter, checked without looping.
+        (parameter_name, index, default), = addresses_as_parameters
+
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            if parameter_name in kwargs:
+                validate(parameter_name, default, kwargs[parameter_name])
+            elif index is not None and index < len(args):
+                validate(parameter_name, default, args[index])
+            elif default is not empty:
+                validate(parameter_name, default, default)
+            return func(*args, **kwargs)
+
+    else:
+
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            for parameter_name, index, default in addresses_as_parameters:
+                if parameter_name in kwargs:
+                    validate(parameter_name, default, kwargs[parameter_name])
+                elif index is not None and index < len(args):
+                    validate(parameter_name, default, args[index])
+                elif default is not empty:
+                    validate(parameter_name, default, default)
+                # otherwise the argument is missing; let the call itself raise TypeError
             return func(*args, **kwargs)
 
     return wrapped
@@ -109,21 +138,38 @@ def validate_checksum_address(func: Callable) -> Callable:
 
 def only_me(func: Callable) -> Callable:
     """Decorator to enforce invocation of permissioned actor methods"""
+    signature = inspect.signature(func)
+
     @functools.wraps(func)
-    def wrapped(actor=None, *args, **kwargs):
-        if not actor.is_me:
-            raise actor.StakerError("You are not {}".format(actor.__class.__.__name__))
-        return func(actor, *args, **kwargs)
+    def wrapped(actor, *args, **kwargs):
+        if actor.is_me:
+            return func(actor, *args, **kwargs)
+        error_class = getattr(actor, 'StakerError', actor.ActorError)
+        raise error_class(f"You are not {type(actor).__name__}")
+
+    wrapped.__signature__ = signature
     return wrapped
 
 
+def receipt_time(timestamp: float) -> datetime:
+    """Converts a saved receipt's POSIX timestamp into a (naive, UTC) datetime"""
+    return datetime.utcfromtimestamp(timestamp)
+
+
 def save_receipt(actor_method) -> Callable:  # TODO: rename to "save_result"?
-    """Decorator to save the result of a function with a timestamp"""
+    """
+    Decorator to save the result of a function with a timestamp.
+    Timestamps are stored as POSIX seconds (time.time()); use `receipt_time` to read them as datetimes.
+    """
+    signature = inspect.signature(actor_method)
+
     @functools.wraps(actor_method)
     def wrapped(self, *args, **kwargs) -> dict:
         receipt_or_txhash = actor_method(self, *args, **kwargs)
-        self._saved_receipts.append((datetime.utcnow(), receipt_or_txhash))
+        self._saved_receipts.append((time.time(), receipt_or_txhash))
         return receipt_or_txhash
+
+    wrapped.__signature__ = signature
     return wrapped
 
 
@@ -136,21 +182,30 @@ def save_receipt(actor_method) -> Callable:  # TODO: rename to "save_result"?
 COLLECT_CONTRACT_API = True
 
 
-def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTERFACE) -> Callable:
-    """Decorator factory for contract API markers"""
+if COLLECT_CONTRACT_API:
 
-    def decorator(agent_method: Callable) -> Callable[..., ContractReturnValue]:
-        """
-        Marks an agent method as containing contract interactions (transaction or call)
-        and validates outbound checksum addresses for EIP-55 compliance.
+    def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTERFACE) -> Callable:
+        """Decorator factory for contract API markers"""
 
-        If `COLLECT_CONTRACT_API` is True when running tests,
-        all marked methods will be collected for automatic mocking
-        and integration with pytest fixtures.
-        """
-        if COLLECT_CONTRACT_API:
+        def decorator(agent_method: Callable) -> Callable[..., ContractReturnValue]:
+            """
+            Marks an agent method as containing contract interactions (transaction or call)
+            and validates outbound checksum addresses for EIP-55 compliance.
+
+            Since `COLLECT_CONTRACT_API` is True, all marked methods will be collected
+            for automatic mocking and integration with pytest fixtures.
+            """
             agent_method.contract_api = interface
-        agent_method = validate_checksum_address(func=agent_method)
-        return agent_method
+            agent_method = validate_checksum_address(func=agent_method)
+            return agent_method
+
+        return decorator
+
+else:
 
-    return decorator
+    def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTERFACE) -> Callable:
+        """
+        Decorator factory for contract API markers with collection disabled;
+        marked methods are only validated for EIP-55 checksum addresses.
+        """
+        return validate_checksum_address
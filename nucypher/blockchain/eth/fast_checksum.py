@@ -0,0 +1,99 @@
+"""
+ This file is part of nucypher.
+
+ nucypher is free software: you can redistribute it and/or modify
+ it under the terms of the GNU Affero General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ nucypher is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU Affero General Public License for more details.
+
+ You should have received a copy of the GNU Affero General Public License
+ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import functools
+import string
+from collections import OrderedDict
+
+from eth_utils import to_checksum_address
+
+try:
+    from sha3 import keccak_256 as _keccak_256
+except ImportError:
+    # pysha3 is unavailable on this platform; defer to eth_utils.
+    _keccak_256 = None
+    from eth_utils import is_checksum_address as _eth_utils_is_checksum_address
+
+
+# Bounded memo of EIP-55 validation results (address -> bool), oldest entries evicted first.
+CHECKSUM_MEMO_SIZE = 4096
+_checksum_memo = OrderedDict()
+
+
+def _memoize_checksum_result(address: str, is_valid: bool) -> None:
+    _checksum_memo[address] = is_valid
+    if len(_checksum_memo) > CHECKSUM_MEMO_SIZE:
+        _checksum_memo.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=1024)
+def cached_to_checksum_address(address: str) -> str:
+    """
+    Memoized eth_utils.to_checksum_address for repeatedly seen addresses.
+    The result is valid by construction, so it is recorded in the checksum
+    validation memo without hashing it again.
+    """
+    checksum_address = to_checksum_address(address)
+    _memoize_checksum_result(checksum_address, True)
+    return checksum_address
+
+
+_HEX_CHARACTERS = frozenset(string.hexdigits)
+
+# Byte translation tables for the branchless EIP-55 case comparison.
+# Each maps an ASCII byte to either 0x20 (the ASCII lowercase bit) or 0x00.
+_ALPHA_MASK = bytes(0x20 if chr(b) in 'abcdefABCDEF' else 0 for b in range(256))
+_LOWERCASE_BITS = bytes(0x20 if chr(b) in 'abcdef' else 0 for b in range(256))
+_EXPECTED_LOWERCASE = bytes(0x20 if chr(b) in '01234567' else 0 for b in range(256))
+
+
+def fast_is_checksum_address(address: str) -> bool:
+    """
+    EIP-55 checksum validation using pysha3's keccak256 directly,
+    bypassing the eth_utils/eth_hash backend dispatch.
+
+    Rather than branching on each of the 40 characters, the observed case of every
+    letter and the case expected from the corresponding hash nibble are packed into
+    two integers and compared at once, masked to the alphabetic positions.
+    """
+    if _keccak_256 is None:
+        return _eth_utils_is_checksum_address(address)
+
+    if not isinstance(address, str) or len(address) != 42 or not address.startswith('0x'):
+        return False
+    hex_address = address[2:]
+    if not _HEX_CHARACTERS.issuperset(hex_address):
+        return False
+
+    address_bytes = hex_address.encode('ascii')
+    address_hash = _keccak_256(address_bytes.lower()).hexdigest().encode('ascii')
+
+    alpha_mask = int.from_bytes(address_bytes.translate(_ALPHA_MASK), 'little')
+    observed = int.from_bytes(address_bytes.translate(_LOWERCASE_BITS), 'little')
+    expected = int.from_bytes(address_hash[:40].translate(_EXPECTED_LOWERCASE), 'little')
+    return not (observed ^ expected) & alpha_mask
+
+
+def cached_is_checksum_address(address: str) -> bool:
+    """Memoized EIP-55 check; caches both valid and invalid results."""
+    try:
+        return _checksum_memo[address]
+    except KeyError:
+        is_valid = fast_is_checksum_address(address)
+        _memoize_checksum_result(address, is_valid)
+        return is_valid
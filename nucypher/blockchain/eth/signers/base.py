@@ -29,6 +29,8 @@ from nucypher.utilities.logging import Logger
 
 class Signer(ABC):
 
+    __slots__ = ()  # concrete signers declare their own instance attributes
+
     _SIGNERS = NotImplemented  # set dynamically in __init__.py
 
     log = Logger(__qualname__)
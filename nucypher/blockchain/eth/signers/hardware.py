@@ -16,26 +16,31 @@
 """
 
 
-import rlp
 from eth_account._utils.transactions import assert_valid_fields, Transaction
 from eth_utils.address import to_canonical_address
-from eth_utils.applicators import apply_key_map, apply_formatters_to_dict
 from eth_utils.conversions import to_int
-from functools import wraps
+from functools import lru_cache, wraps
 from hexbytes import HexBytes
 from toolz.dicttoolz import dissoc
-from trezorlib import ethereum
-from trezorlib.client import get_default_client, TrezorClient
-from trezorlib.tools import parse_path, Address, H_
-from trezorlib.transport import TransportException
-from typing import List, Tuple, Union
+from typing import List, Tuple, Union, TYPE_CHECKING
 from web3 import Web3
 
+if TYPE_CHECKING:
+    # trezorlib, usb1 and rlp are imported lazily so that non-trezor users do not pay for them.
+    from trezorlib.client import TrezorClient
+
 from nucypher.blockchain.eth.decorators import validate_checksum_address
 from nucypher.blockchain.eth.signers.base import Signer
 from nucypher.characters.control.emitters import StdoutEmitter
 
 
+@lru_cache(maxsize=256)
+def _parse_hd_path(path: str) -> Tuple[int, ...]:
+    """Memoized trezorlib BIP-32 path parsing; the result is a pure function of the path string."""
+    from trezorlib.tools import parse_path
+    return tuple(parse_path(path))
+
+
 def handle_trezor_call(device_func):
     """
     Decorator for calls to trezorlib that require physical device interactions.
@@ -59,6 +64,8 @@ def handle_trezor_call(device_func):
 class TrezorSigner(Signer):
     """A trezor message and transaction signing client."""
 
+    __slots__ = ('__client', '_device_id', 'testnet', '__addresses')
+
     # BIP44 HD derivation paths
     # https://wiki.trezor.io/Cryptocurrency_standards#bip44
     # https://wiki.trezor.io/Cryptocurrency_standards#slip44
@@ -71,6 +78,9 @@ class TrezorSigner(Signer):
     _CHAIN_ID = 0
     _DEFAULT_ACCOUNT = 0
 
+    # Web3.py -> Trezor native transaction field names
+    _TREZOR_TRANSACTION_KEYS = {'gas': 'gas_limit', 'gasPrice': 'gas_price', 'chainId': 'chain_id'}
+
     # Cache
     DEFAULT_ACCOUNT_INDEX = 0
     ADDRESS_CACHE_SIZE = 10  # default number of accounts to derive and internally track
@@ -97,7 +107,9 @@ class TrezorSigner(Signer):
         return path
 
     @handle_trezor_call
-    def _open(self) -> TrezorClient:
+    def _open(self) -> 'TrezorClient':
+        from trezorlib.client import get_default_client
+        from trezorlib.transport import TransportException
         try:
             client = get_default_client()
         except TransportException:
@@ -113,12 +125,12 @@ class TrezorSigner(Signer):
     # Internal
     #
 
-    def __get_address_path(self, index: int = None, checksum_address: str = None) -> List[H_]:
+    def __get_address_path(self, index: int = None, checksum_address: str = None) -> List[int]:
         """Resolves a checksum address into an HD path and returns it."""
         if index is not None and checksum_address:
             raise ValueError("Expected index or checksum address; Got both.")
         elif index is not None:
-            hd_path = parse_path(f"{self.derivation_root}/{index}")
+            hd_path = list(_parse_hd_path(f"{self.derivation_root}/{index}"))
         else:
             try:
                 hd_path = self.__addresses[checksum_address]
@@ -127,8 +139,9 @@ class TrezorSigner(Signer):
         return hd_path
 
     @handle_trezor_call
-    def __derive_account(self, index: int = None, hd_path: Address = None) -> str:
+    def __derive_account(self, index: int = None, hd_path: List[int] = None) -> str:
         """Resolves a trezorlib HD path into a checksum address and returns it."""
+        from trezorlib import ethereum
         if not hd_path:
             if index is None:
                 raise ValueError("No index or HD path supplied.")  # TODO: better error handling here
@@ -149,20 +162,21 @@ class TrezorSigner(Signer):
             message = f"Derived {address} ({self.derivation_root}/{index})"
             emitter.message(message)
 
-    @staticmethod
-    def _format_transaction(transaction_dict: dict) -> dict:
+    @classmethod
+    def _format_transaction(cls, transaction_dict: dict) -> dict:
         """
         Handle Web3.py -> Trezor native transaction field formatting (non-mutative)
         # https://web3py.readthedocs.io/en/latest/web3.eth.html#web3.eth.Eth.sendRawTransaction
         """
         assert_valid_fields(transaction_dict)
-        trezor_transaction_keys = {'gas': 'gas_limit', 'gasPrice': 'gas_price', 'chainId': 'chain_id'}
-        trezor_transaction = dict(apply_key_map(trezor_transaction_keys, transaction_dict))
+        keys = cls._TREZOR_TRANSACTION_KEYS
+        trezor_transaction = {keys.get(key, key): value for key, value in transaction_dict.items()}
         return trezor_transaction
 
     @handle_trezor_call
     def __sign_transaction(self, n: List[int], trezor_transaction: dict) -> Tuple[bytes, bytes, bytes]:
         """Internal wrapper for trezorlib transaction signing calls"""
+        from trezorlib import ethereum
         v, r, s = ethereum.sign_tx(client=self.__client, n=n, **trezor_transaction)
         return v, r, s
 
@@ -204,6 +218,7 @@ class TrezorSigner(Signer):
         This method requires interaction between the TREZOR and the user.
         """
         # TODO: #2262 Implement Trezor Message Signing
+        from trezorlib import ethereum
         hd_path = self.__get_address_path(checksum_address=checksum_address)
         signed_message = ethereum.sign_message(self.__client, hd_path, message)
         return HexBytes(signed_message.signature)
@@ -242,11 +257,11 @@ class TrezorSigner(Signer):
             sender_address = transaction_dict['from']
         except KeyError:
             raise self.SignerError("'from' field is missing from trezor signing request.")
-        transaction_dict = dissoc(transaction_dict, 'from')
+        transaction_dict = dissoc(transaction_dict, 'from')  # copy
 
         # Format contract data field for both trezor and eth_account's Transaction
-        formatters = {'data': lambda data: Web3.toBytes(HexBytes(data))}
-        transaction_dict = dict(apply_formatters_to_dict(formatters, transaction_dict))
+        if 'data' in transaction_dict:
+            transaction_dict['data'] = Web3.toBytes(HexBytes(transaction_dict['data']))
 
         # Format transaction fields for Trezor, Lookup HD path
         trezor_transaction = self._format_transaction(transaction_dict=transaction_dict)
@@ -262,11 +277,11 @@ class TrezorSigner(Signer):
 
         # Create RLP serializable Transaction instance with eth_account
         # chainId is not longer needed since it can later be derived from v
-        transaction_dict = dissoc(transaction_dict, 'chainId')
+        del transaction_dict['chainId']
 
         # 'to' may be blank if this transaction is contract creation
-        formatters = {'to': to_canonical_address}
-        transaction_dict = dict(apply_formatters_to_dict(formatters, transaction_dict))
+        if 'to' in transaction_dict:
+            transaction_dict['to'] = to_canonical_address(transaction_dict['to'])
 
         signed_transaction = Transaction(v=to_int(_v),  # type: int
                                          r=to_int(_r),  # bytes -> int
@@ -275,5 +290,6 @@ class TrezorSigner(Signer):
 
         # Optionally encode as RLP for broadcasting
         if rlp_encoded:
+            import rlp
             signed_transaction = HexBytes(rlp.encode(signed_transaction))
         return signed_transaction
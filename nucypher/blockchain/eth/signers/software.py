@@ -15,12 +15,13 @@
  along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import json
 import os
 import stat
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from json.decoder import JSONDecodeError
-from typing import List, Dict, Tuple
+from typing import List, Dict, FrozenSet, Tuple
 from urllib.parse import urlparse
 
 from cytoolz.dicttoolz import dissoc
@@ -33,16 +34,34 @@ from hexbytes.main import HexBytes
 from web3.main import Web3
 from web3.providers.ipc import IPCProvider
 
+try:
+    from orjson import loads as json_loads  # faster keyfile decoding when available
+except ImportError:
+    from json import loads as json_loads
+
 from nucypher.blockchain.eth.constants import NULL_ADDRESS
 from nucypher.blockchain.eth.decorators import validate_checksum_address
+from nucypher.blockchain.eth.fast_checksum import cached_to_checksum_address
 from nucypher.blockchain.eth.signers.base import Signer
 
 
+def _as_hexbytes(value) -> HexBytes:
+    """Wraps a signature as HexBytes, skipping the conversion if it already is one."""
+    return value if type(value) is HexBytes else HexBytes(value)
+
+
 class Web3Signer(Signer):
 
+    __slots__ = ('__client', '__hw_addresses', '__hw_addresses_read_at')
+
+    HW_WALLET_URL_PREFIXES = ('trezor', 'ledger')
+    HW_WALLET_CACHE_TTL = 10  # seconds; devices can be connected or disconnected at any time
+
     def __init__(self, client):
         super().__init__()
         self.__client = client
+        self.__hw_addresses = None  # lazily populated by _hw_addresses
+        self.__hw_addresses_read_at = 0.0
 
     @classmethod
     def uri_scheme(cls) -> str:
@@ -65,30 +84,63 @@ class Web3Signer(Signer):
     def accounts(self) -> List[str]:
         return self.__client.accounts
 
+    def _hw_addresses(self, refresh: bool = False) -> FrozenSet[str]:
+        """
+        Returns the checksum addresses of connected hardware wallet accounts.
+        The result is cached for HW_WALLET_CACHE_TTL seconds unless `refresh` is True.
+        """
+        expired = time.monotonic() - self.__hw_addresses_read_at > self.HW_WALLET_CACHE_TTL
+        if refresh or expired or self.__hw_addresses is None:
+            try:
+                # TODO: Temporary fix for #1128 and #1385. It's ugly af, but it works. Move somewhere else?
+                wallets = self.__client.wallets
+            except AttributeError:
+                hw_addresses = frozenset()
+            else:
+                hw_addresses = frozenset(cached_to_checksum_address(account['address'])
+                                         for wallet in wallets if wallet['url'].startswith(self.HW_WALLET_URL_PREFIXES)
+                                         for account in wallet['accounts'])
+            self.__hw_addresses = hw_addresses
+            self.__hw_addresses_read_at = time.monotonic()
+        return self.__hw_addresses
+
+    def invalidate_hw_cache(self) -> None:
+        """Forget cached hardware wallet accounts so they are re-read from the client on next use."""
+        self.__hw_addresses = None
+        self.__hw_addresses_read_at = 0.0
+
     @validate_checksum_address
     def is_device(self, account: str):
-        try:
-            # TODO: Temporary fix for #1128 and #1385. It's ugly af, but it works. Move somewhere else?
-            wallets = self.__client.wallets
-        except AttributeError:
+        return account in self._hw_addresses()
+
+    def __is_connected_device(self, account: str) -> bool:
+        """
+        Like is_device, but a cached positive result is confirmed against the client before
+        it is used to skip unlocking or locking, in case the device has since been disconnected.
+        """
+        read_at = self.__hw_addresses_read_at
+        if not self.is_device(account=account):
             return False
-        else:
-            HW_WALLET_URL_PREFIXES = ('trezor', 'ledger')
-            hw_accounts = [w['accounts'] for w in wallets if w['url'].startswith(HW_WALLET_URL_PREFIXES)]
-            hw_addresses = [to_checksum_address(account['address']) for sublist in hw_accounts for account in sublist]
-            return account in hw_addresses
+        if self.__hw_addresses_read_at != read_at:
+            return True  # wallets were just read from the client
+        return account in self._hw_addresses(refresh=True)
 
     @validate_checksum_address
     def unlock_account(self, account: str, password: str, duration: int = None):
-        if self.is_device(account=account):
+        if self.__is_connected_device(account=account):
             unlocked = True
         else:
-            unlocked = self.__client.unlock_account(account=account, password=password, duration=duration)
+            unlocked = False
+            try:
+                unlocked = self.__client.unlock_account(account=account, password=password, duration=duration)
+            finally:
+                if not unlocked:
+                    self.invalidate_hw_cache()  # a device may have been connected since the last lookup
         return unlocked
 
     @validate_checksum_address
     def lock_account(self, account: str):
-        if self.is_device(account=account):
+        if self.__is_connected_device(account=account):
             result = None  # TODO: Force Disconnect Devices?
         else:
             result = self.__client.lock_account(account=account)
@@ -97,7 +149,7 @@ class Web3Signer(Signer):
     @validate_checksum_address
     def sign_message(self, account: str, message: bytes, **kwargs) -> HexBytes:
         signature = self.__client.sign_message(account=account, message=message)
-        return HexBytes(signature)
+        return _as_hexbytes(signature)
 
     def sign_transaction(self, transaction_dict: dict) -> HexBytes:
         signed_raw_transaction = self.__client.sign_transaction(transaction_dict=transaction_dict)
@@ -117,6 +169,17 @@ class ClefSigner(Signer):
 
     TIMEOUT = 60  # Default timeout for Clef of 60 seconds
 
+    __slots__ = ('w3', 'ipc_path', 'testnet')
+
+    _BASE_TX_FORMATTERS = {
+        'nonce': Web3.toHex,
+        'gasPrice': Web3.toHex,
+        'gas': Web3.toHex,
+        'value': Web3.toHex,
+        'chainId': Web3.toHex,
+        'from': to_checksum_address
+    }
+
     def __init__(self,
                  ipc_path: str = DEFAULT_IPC_PATH,
                  timeout: int = TIMEOUT,
@@ -165,29 +228,21 @@ class ClefSigner(Signer):
     @property
     def accounts(self) -> List[str]:
         normalized_addresses = self.__ipc_request(endpoint="account_list")
-        checksum_addresses = [to_checksum_address(addr) for addr in normalized_addresses]
+        checksum_addresses = [cached_to_checksum_address(addr) for addr in normalized_addresses]
         return checksum_addresses
 
     @validate_checksum_address
     def sign_transaction(self, transaction_dict: dict) -> HexBytes:
-        formatters = {
-            'nonce': Web3.toHex,
-            'gasPrice': Web3.toHex,
-            'gas': Web3.toHex,
-            'value': Web3.toHex,
-            'chainId': Web3.toHex,
-            'from': to_checksum_address
-        }
-
         # Workaround for contract creation TXs
-        if transaction_dict['to'] == b'':
-            transaction_dict['to'] = None
-        elif transaction_dict['to']:
-            formatters['to'] = to_checksum_address
+        if not transaction_dict.get('to'):
+            formatters = self._BASE_TX_FORMATTERS
+            transaction_dict = {**transaction_dict, 'to': None}
+        else:
+            formatters = {**self._BASE_TX_FORMATTERS, 'to': to_checksum_address}
 
         formatted_transaction = apply_formatters_to_dict(formatters, transaction_dict)
         signed = self.__ipc_request("account_signTransaction", formatted_transaction)
-        return HexBytes(signed.raw)
+        return _as_hexbytes(signed.raw)
 
     @validate_checksum_address
     def sign_message(self, account: str, message: bytes, content_type: str = None, validator_address: str = None, **kwargs) -> HexBytes:
@@ -212,7 +267,7 @@ class ClefSigner(Signer):
             raise NotImplementedError
 
         signed_data = self.__ipc_request("account_signData", content_type, account, data)
-        return HexBytes(signed_data)
+        return _as_hexbytes(signed_data)
 
     def sign_data_for_validator(self, account: str, message: bytes, validator_address: str):
         signature = self.sign_message(account=account,
@@ -233,9 +288,13 @@ class ClefSigner(Signer):
 class KeystoreSigner(Signer):
     """Local Web3 signer implementation supporting keystore files"""
 
+    __slots__ = ('__path', '__keys', '__signers', 'testnet')
+
     __keys: Dict[str, dict]
     __signers: Dict[str, LocalAccount]
 
+    MAX_KEYFILE_READ_WORKERS = 32
+
     class InvalidKeyfile(Signer.SignerError, RuntimeError):
         """
         Raised when a keyfile is corrupt or otherwise invalid.
@@ -265,7 +324,7 @@ class KeystoreSigner(Signer):
         try:
             st_mode = os.stat(path=path).st_mode
             if stat.S_ISDIR(st_mode):
-                paths = (entry.path for entry in os.scandir(path=path) if entry.is_file())
+                paths = [entry.path for entry in os.scandir(path=path) if entry.is_file()]
             elif stat.S_ISREG(st_mode):
                 paths = (path,)
             else:
@@ -278,15 +337,20 @@ class KeystoreSigner(Signer):
             raise self.InvalidSignerURI(message)
         except OSError as exc:
             raise self.InvalidSignerURI(f'Error accessing keystore file or directory "{path}": {exc}')
-        for path in paths:
-            account, key_metadata = self.__handle_keyfile(path=path)
+        if len(paths) > 1:
+            # Keyfile reads are I/O bound; read keystore directories concurrently.
+            with ThreadPoolExecutor(max_workers=min(self.MAX_KEYFILE_READ_WORKERS, len(paths))) as executor:
+                keyfiles = list(executor.map(self.__handle_keyfile, paths))
+        else:
+            keyfiles = [self.__handle_keyfile(path=keyfile_path) for keyfile_path in paths]
+        for account, key_metadata in keyfiles:
             self.__keys[account] = key_metadata
 
     @staticmethod
     def __read_keyfile(path: str) -> tuple:
         """Read an individual keystore key file from the disk"""
-        with open(path, 'r') as keyfile:
-            key_metadata = json.load(keyfile)
+        with open(path, 'rb') as keyfile:
+            key_metadata = json_loads(keyfile.read())
         address = key_metadata['address']
         return address, key_metadata
 
@@ -300,7 +364,7 @@ class KeystoreSigner(Signer):
         except FileNotFoundError:
             error = f"No such keyfile '{path}'"
             raise self.InvalidKeyfile(error)
-        except JSONDecodeError:
+        except JSONDecodeError:  # orjson.JSONDecodeError is a subclass
             error = f"Invalid JSON in keyfile at {path}"
             raise self.InvalidKeyfile(error)
         except KeyError:
@@ -309,7 +373,7 @@ class KeystoreSigner(Signer):
         else:
             if not is_address(address):
                 raise self.InvalidKeyfile(f"'{path}' does not contain a valid ethereum address")
-            address = to_checksum_address(address)
+            address = cached_to_checksum_address(address)
         return address, key_metadata
 
     @validate_checksum_address
@@ -405,4 +469,4 @@ class KeystoreSigner(Signer):
     def sign_message(self, account: str, message: bytes, **kwargs) -> HexBytes:
         signer = self.__get_signer(account=account)
         signature = signer.sign_message(signable_message=encode_defunct(primitive=message)).signature
-        return HexBytes(signature)
+        return _as_hexbytes(signature)
@@ -17,6 +17,7 @@
 
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -28,7 +29,7 @@ from eth_utils.address import to_checksum_address
 from hexbytes.main import HexBytes
 
 from nucypher.blockchain.eth.constants import LENGTH_ECDSA_SIGNATURE_WITH_RECOVERY
-from nucypher.blockchain.eth.signers import KeystoreSigner, Signer
+from nucypher.blockchain.eth.signers import KeystoreSigner, Signer, software
 from tests.constants import INSECURE_DEVELOPMENT_PASSWORD
 
 # Example keystore filename
@@ -149,6 +150,32 @@ def test_create_signer_from_keystore_directory(mock_account, mock_keystore):
     assert mock_account.address in signer.accounts
 
 
+def test_create_signer_from_multi_file_keystore_directory(mocker, tmp_path):
+    accounts = [Account.create() for _ in range(4)]
+    for index, account in enumerate(accounts):
+        keyfile_path = tmp_path / f'UTC--2019-12-0{index + 1}T05-39-04.006429310Z--{account.address}'
+        keyfile_path.write_text(json.dumps({'address': account.address.lower(), 'version': 3}))
+
+    # Keystore directories are read through the thread pool
+    pool = mocker.patch.object(software, 'ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    signer = Signer.from_signer_uri(uri=f'keystore:{tmp_path}', testnet=True)  # type: KeystoreSigner
+    assert pool.call_count == 1
+    assert sorted(signer.accounts) == sorted(account.address for account in accounts)  # checksummed
+
+    # A single keyfile is read inline, without a thread pool
+    pool.reset_mock()
+    keyfile_path = next(tmp_path.iterdir())
+    signer = Signer.from_signer_uri(uri=f'keystore:{keyfile_path}', testnet=True)  # type: KeystoreSigner
+    assert pool.call_count == 0
+    assert len(signer.accounts) == 1
+
+    # An invalid keyfile read by a pool worker still surfaces as InvalidKeyfile
+    (tmp_path / 'corrupted').write_text('{not json')
+    with pytest.raises(KeystoreSigner.InvalidKeyfile, match='Invalid JSON in keyfile at'):
+        Signer.from_signer_uri(uri=f'keystore:{tmp_path}', testnet=True)
+    assert pool.call_count == 1
+
+
 def test_create_signer_from_keystore_file(mock_account, mock_keystore):
     mock_keystore_path = mock_keystore / MOCK_KEYFILE_NAME
     mock_keystore_uri = f'keystore:{mock_keystore_path}'
@@ -15,9 +15,19 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import inspect
+import time
+from datetime import datetime, timedelta
+
 import pytest
 
-from nucypher.blockchain.eth.decorators import InvalidChecksumAddress, validate_checksum_address
+from nucypher.blockchain.eth.decorators import (
+    InvalidChecksumAddress,
+    only_me,
+    receipt_time,
+    save_receipt,
+    validate_checksum_address
+)
 
 
 def test_validate_checksum_address(get_random_checksum_address):
@@ -73,3 +83,104 @@ def test_validate_checksum_address(get_random_checksum_address):
     assert multiple_checksum_addresses(42,
                                        worker_address=get_random_checksum_address(),
                                        staking_address=get_random_checksum_address())
+
+
+def test_validate_checksum_address_on_methods(get_random_checksum_address):
+
+    class Thing:
+
+        @validate_checksum_address
+        def positional(self, account, staking_address=None):
+            return True
+
+        @validate_checksum_address
+        def keyword_only(self, *, checksum_address):
+            return True
+
+    thing = Thing()
+
+    assert thing.positional(get_random_checksum_address())
+    assert thing.positional(account=get_random_checksum_address(), staking_address=None)
+
+    with pytest.raises(InvalidChecksumAddress):
+        thing.positional("0x_NOT_VALID")
+
+    with pytest.raises(InvalidChecksumAddress):
+        thing.positional(get_random_checksum_address(), staking_address="0x_NOT_VALID")
+
+    assert thing.keyword_only(checksum_address=get_random_checksum_address())
+
+    with pytest.raises(TypeError):
+        thing.keyword_only(checksum_address=42)
+
+
+def test_validate_checksum_address_preserves_signature():
+
+    def func(whatever, staking_address=None, *args, **kwargs):
+        return True
+
+    decorated = validate_checksum_address(func)
+    assert decorated.__wrapped__ is func
+    assert inspect.signature(decorated) == inspect.signature(func)
+
+
+def test_only_me():
+
+    class Actor:
+
+        class ActorError(Exception):
+            pass
+
+        class StakerError(ActorError):
+            pass
+
+        def __init__(self, is_me: bool):
+            self.is_me = is_me
+
+        @only_me
+        def permissioned(self, value):
+            return value
+
+    assert Actor(is_me=True).permissioned(42) == 42
+
+    with pytest.raises(Actor.StakerError, match='You are not Actor'):
+        Actor(is_me=False).permissioned(42)
+
+
+def test_validate_checksum_address_without_address_parameters():
+
+    def no_addresses(whatever, **kwargs):
+        return True
+
+    assert validate_checksum_address(no_addresses) is no_addresses
+
+
+def test_save_receipt():
+
+    class Actor:
+
+        def __init__(self):
+            self._saved_receipts = list()
+
+        @save_receipt
+        def transact(self, receipt):
+            return receipt
+
+    actor = Actor()
+    receipt = {'transactionHash': b'fake'}
+
+    before = time.time()
+    assert actor.transact(receipt) is receipt
+    after = time.time()
+
+    assert len(actor._saved_receipts) == 1
+    timestamp, saved_receipt = actor._saved_receipts[0]
+    assert saved_receipt is receipt
+    assert isinstance(timestamp, float)
+    assert before <= timestamp <= after
+
+    # timestamps round-trip into naive UTC datetimes
+    saved_at = receipt_time(timestamp)
+    assert saved_at.tzinfo is None
+    assert saved_at == datetime.utcfromtimestamp(timestamp)
+    assert abs(saved_at - datetime.utcnow()) < timedelta(minutes=1)
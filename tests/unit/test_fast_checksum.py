@@ -0,0 +1,128 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import pytest
+from eth_hash.auto import keccak
+from eth_utils import is_checksum_address
+
+from nucypher.blockchain.eth import fast_checksum
+from nucypher.blockchain.eth.fast_checksum import (
+    cached_is_checksum_address,
+    cached_to_checksum_address,
+    fast_is_checksum_address
+)
+
+
+# https://github.com/ethereum/EIPs/blob/master/EIPS/eip-55.md#test-cases
+EIP_55_TEST_CASES = (
+    '0x52908400098527886E0F7030069857D2E4169EE7',
+    '0x8617E340B3D01FA5F11F306F4090FD50E238070D',
+    '0xde709f2102306220921060314715629080e2fb77',
+    '0x27b1fdb04752bbc536007a920d24acb045561c26',
+    '0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed',
+    '0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359',
+    '0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB',
+    '0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb',
+)
+
+
+@pytest.mark.parametrize('checksum_address', EIP_55_TEST_CASES)
+def test_fast_is_checksum_address_eip_55_test_cases(checksum_address):
+    assert fast_is_checksum_address(checksum_address)
+
+
+@pytest.mark.parametrize('invalid', (
+    None,
+    123,
+    b'0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed',
+    '0x_NOT_VALID',
+    '0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAe',    # too short
+    '5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed',      # no prefix
+    '0x5aaeb6053f3e94c9b9a09f33669435e7ef1beaed',    # all lowercase
+    '0x5AAEB6053F3E94C9B9A09F33669435E7EF1BEAED',    # all uppercase
+    '0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAeZ',    # not hex
+))
+def test_fast_is_checksum_address_rejects_invalid(invalid):
+    assert not fast_is_checksum_address(invalid)
+
+
+def test_fast_is_checksum_address_matches_eth_utils(get_random_checksum_address):
+    for _ in range(100):
+        checksum_address = get_random_checksum_address()
+        assert fast_is_checksum_address(checksum_address) is is_checksum_address(checksum_address)
+        assert fast_is_checksum_address(checksum_address.lower()) is is_checksum_address(checksum_address.lower())
+
+
+def test_cached_to_checksum_address_seeds_checksum_validation_memo(mocker, get_random_checksum_address):
+    checksum_address = get_random_checksum_address()
+    result = cached_to_checksum_address(checksum_address.lower())
+    assert result == checksum_address
+
+    # Validating an address we checksummed ourselves does not hash it again
+    spy = mocker.patch.object(fast_checksum, 'fast_is_checksum_address', wraps=fast_is_checksum_address)
+    assert cached_is_checksum_address(result)
+    assert spy.call_count == 0
+
+    # Addresses that were not seeded are validated once, then memoized (including failures)
+    lowercase_address = checksum_address.lower()
+    expected = fast_is_checksum_address(lowercase_address)
+    assert cached_is_checksum_address(lowercase_address) is expected
+    assert cached_is_checksum_address(lowercase_address) is expected
+    assert spy.call_count == 1
+
+
+class EthHashKeccak256:
+    """Minimal pysha3 keccak_256 stand-in backed by eth_hash (always installed with eth_utils)"""
+
+    def __init__(self, data: bytes):
+        self.__digest = keccak(data)
+
+    def hexdigest(self) -> str:
+        return self.__digest.hex()
+
+
+@pytest.fixture(scope='function')
+def fast_keccak_backend(monkeypatch):
+    """Force the pysha3 code path of fast_is_checksum_address, even if pysha3 is not installed."""
+    monkeypatch.setattr(fast_checksum, '_keccak_256', EthHashKeccak256)
+    monkeypatch.setattr(fast_checksum, '_eth_utils_is_checksum_address', None, raising=False)  # no fallback
+
+
+def test_pysha3_backend_is_used_when_installed():
+    pytest.importorskip('sha3')
+    assert fast_checksum._keccak_256 is not None
+
+
+@pytest.mark.parametrize('checksum_address', EIP_55_TEST_CASES)
+def test_fast_path_eip_55_test_cases(fast_keccak_backend, checksum_address):
+    assert fast_is_checksum_address(checksum_address)
+
+    # Flipping the case of any single letter invalidates the checksum
+    for index, character in enumerate(checksum_address[2:], start=2):
+        if character.isalpha():
+            flipped = checksum_address[:index] + character.swapcase() + checksum_address[index + 1:]
+            assert not fast_is_checksum_address(flipped)
+
+
+def test_fast_path_matches_eth_utils(fast_keccak_backend, get_random_checksum_address):
+    for _ in range(100):
+        checksum_address = get_random_checksum_address()
+        assert fast_is_checksum_address(checksum_address)
+        assert fast_is_checksum_address(checksum_address.lower()) is is_checksum_address(checksum_address.lower())
+        assert fast_is_checksum_address(checksum_address.upper().replace('0X', '0x')) is \
+            is_checksum_address(checksum_address.upper().replace('0X', '0x'))
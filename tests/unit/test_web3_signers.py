@@ -25,9 +25,9 @@ from hexbytes import HexBytes
 from toolz.dicttoolz import assoc
 from trezorlib.messages import EthereumGetAddress
 
-from nucypher.blockchain.eth import signers
 from nucypher.blockchain.eth.signers import Signer
 from nucypher.blockchain.eth.signers import TrezorSigner
+from nucypher.blockchain.eth.signers.software import Web3Signer
 
 TRANSACTION_DICT = {
     'chainId': 1,
@@ -57,6 +57,95 @@ def test_blank_keystore_uri():
         Signer.from_signer_uri(uri='keystore://', testnet=True)  # it's blank!
 
 
+class FakeWalletClient:
+    """Fake web3 client with hot-pluggable hardware wallets"""
+
+    class UnlockFailed(Exception):
+        pass
+
+    def __init__(self, software_address: str):
+        self.software_address = software_address
+        self.hw_addresses = list()
+        self.wallet_reads = 0
+        self.unlocked = set()
+
+    @property
+    def wallets(self):
+        self.wallet_reads += 1
+        return [{'url': 'trezor://1', 'accounts': [{'address': a.lower()} for a in self.hw_addresses]},
+                {'url': 'keystore:///tmp', 'accounts': [{'address': self.software_address.lower()}]}]
+
+    def unlock_account(self, account, password, duration=None):
+        if account != self.software_address:
+            raise self.UnlockFailed(account)  # geth and parity report failure as a JSON-RPC error
+        self.unlocked.add(account)
+        return True
+
+    def lock_account(self, account):
+        self.unlocked.discard(account)
+        return True
+
+
+def test_web3_signer_hardware_wallet_cache(mocker, mock_account):
+    software_address = TRANSACTION_DICT['to']
+    client = FakeWalletClient(software_address=software_address)
+    client.hw_addresses.append(mock_account.address)
+
+    signer = Web3Signer(client=client)
+    assert signer.is_device(account=mock_account.address)
+    assert not signer.is_device(account=software_address)
+    assert client.wallet_reads == 1  # cached
+
+    signer.invalidate_hw_cache()
+    assert signer.is_device(account=mock_account.address)
+    assert client.wallet_reads == 2
+
+    # cache expires
+    mocker.patch.object(Web3Signer, 'HW_WALLET_CACHE_TTL', -1)
+    assert signer.is_device(account=mock_account.address)
+    assert client.wallet_reads == 3
+
+
+def test_web3_signer_hardware_wallet_disconnected(mock_account):
+    client = FakeWalletClient(software_address=TRANSACTION_DICT['to'])
+    client.hw_addresses.append(mock_account.address)
+    signer = Web3Signer(client=client)
+    assert signer.is_device(account=mock_account.address)  # populate the cache
+
+    # Unplug the device; the stale cache must not short-circuit unlocking or locking.
+    client.hw_addresses.clear()
+    with pytest.raises(FakeWalletClient.UnlockFailed):
+        signer.unlock_account(account=mock_account.address, password='')
+    assert client.wallet_reads == 2  # the cached positive result was confirmed once
+
+    assert not signer.is_device(account=mock_account.address)
+    assert client.wallet_reads == 3  # re-read after the failed unlock invalidated the cache
+    assert signer.lock_account(account=mock_account.address)
+    assert client.wallet_reads == 3  # cached negative results are not re-read
+
+
+def test_web3_signer_hardware_wallet_connected(mock_account):
+    client = FakeWalletClient(software_address=TRANSACTION_DICT['to'])
+    signer = Web3Signer(client=client)
+    assert not signer.is_device(account=mock_account.address)  # populate the cache
+
+    # Plug in the device; a failed unlock refreshes the cache.
+    client.hw_addresses.append(mock_account.address)
+    with pytest.raises(FakeWalletClient.UnlockFailed):
+        signer.unlock_account(account=mock_account.address, password='')
+    assert client.wallet_reads == 1  # cached negative result; the client's unlock failure invalidates
+
+    # A freshly read cache is not read a second time to confirm the device
+    assert signer.unlock_account(account=mock_account.address, password='')
+    assert client.wallet_reads == 2
+
+    # A positive result from an older cache is confirmed with a single read
+    assert signer.lock_account(account=mock_account.address) is None
+    assert client.wallet_reads == 3
+    assert signer.is_device(account=mock_account.address)
+    assert client.wallet_reads == 3
+
+
 def test_trezor_transaction_format():
     trezor_transaction = TrezorSigner._format_transaction(TRANSACTION_DICT)
     assert trezor_transaction['chain_id'] == TRANSACTION_DICT['chainId']
@@ -87,7 +176,7 @@ def mock_trezor(mocker, mock_account):
         def get_address(self, *args, **kwargs):
             return mock_account.address
 
-    mocker.patch.object(signers.hardware, 'get_default_client', return_value=FakeTrezorClient())
+    mocker.patch('trezorlib.client.get_default_client', return_value=FakeTrezorClient())
     mocker.patch.object(TrezorSigner, '_open')
     mocker.patch.object(TrezorSigner, '_TrezorSigner__derive_account', return_value=mock_account.address)
     mocker.patch.object(TrezorSigner, '_TrezorSigner__sign_transaction', return_value=FakeTrezorClient.faked_vrs)